@@ -0,0 +1,115 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "scripts"))
+import graph_analytics
+
+
+# Path nm1 - tt1 - nm2 - tt2 - nm3, a separate pair nm4 - tt3 and an isolated nm5.
+# nm1 has two categories in tt1 and one role points at a movie that does not exist.
+PEOPLE = 'nm1,"Bacon, Kevin",1958\nnm2,B,\nnm3,C,1970\nnm4,D,\nnm5,E,\n'
+MOVIES = "tt1,M1,2000\ntt2,M2,\ntt3,M3,2001\n"
+ROLES = (
+    "tt1,nm1,actor\n"
+    "tt1,nm1,director\n"
+    "tt1,nm2,actress\n"
+    "tt2,nm2,actor\n"
+    "tt2,nm3,actor\n"
+    "tt3,nm4,actor\n"
+    "tt9,nm1,actor\n"
+)
+
+TRUE_ECCENTRICITY = {"nm1": 4, "tt1": 3, "nm2": 2, "tt2": 3, "nm3": 4}
+
+
+def _run(tmp_path, samples):
+    input_dir = tmp_path / "import"
+    output_dir = tmp_path / "analytics"
+    input_dir.mkdir()
+    (input_dir / "people.csv").write_text(PEOPLE, encoding="utf-8")
+    (input_dir / "movies.csv").write_text(MOVIES, encoding="utf-8")
+    (input_dir / "roles.csv").write_text(ROLES, encoding="utf-8")
+
+    graph_analytics.run_analytics(str(input_dir), str(output_dir), workers=1, samples=samples)
+    return {
+        name: pd.read_parquet(output_dir / f"{name}.parquet")
+        for name in ("node_metrics", "degree_distribution", "components", "summary")
+    }
+
+
+def test_metrics_with_every_giant_node_sampled(tmp_path):
+    reports = _run(tmp_path, samples=64)
+    nodes = reports["node_metrics"].set_index("id")
+
+    assert nodes["type"].to_dict() == {
+        "nm1": "person", "nm2": "person", "nm3": "person", "nm4": "person", "nm5": "person",
+        "tt1": "movie", "tt2": "movie", "tt3": "movie",
+    }
+    assert nodes["degree"].to_dict() == {
+        "nm1": 1, "nm2": 2, "nm3": 1, "nm4": 1, "nm5": 0, "tt1": 2, "tt2": 2, "tt3": 1,
+    }
+
+    component = nodes["component"]
+    assert component[["nm1", "nm2", "nm3", "tt1", "tt2"]].nunique() == 1
+    assert component["nm4"] == component["tt3"]
+    assert len({component["nm1"], component["nm4"], component["nm5"]}) == 3
+    assert nodes["component_size"].to_dict() == {
+        "nm1": 5, "nm2": 5, "nm3": 5, "nm4": 2, "nm5": 1, "tt1": 5, "tt2": 5, "tt3": 2,
+    }
+
+    costar = nodes["costar_degree"]
+    assert costar[["nm1", "nm2", "nm3", "nm4", "nm5"]].tolist() == [1, 2, 1, 0, 0]
+    assert costar[["tt1", "tt2", "tt3"]].isna().all()
+
+    giant = list(TRUE_ECCENTRICITY)
+    assert nodes.loc[giant, "eccentricity"].to_dict() == TRUE_ECCENTRICITY
+    assert nodes.loc[giant, "eccentricity_exact"].all()
+    assert nodes.loc[["nm4", "nm5", "tt3"], "eccentricity"].isna().all()
+    assert not nodes.loc[["nm4", "nm5", "tt3"], "eccentricity_exact"].any()
+
+    # nm2 is at distances 1, 1, 2, 2 from the other four sampled nodes
+    assert nodes.loc["nm2", "closeness"] == pytest.approx(4 / 6)
+    assert nodes.loc["nm1", "closeness"] == pytest.approx(4 / 10)
+    assert nodes.loc[["nm4", "nm5", "tt3"], "closeness"].isna().all()
+
+    summary = reports["summary"].iloc[0]
+    assert summary["nodes"] == 8
+    assert summary["people"] == 5
+    assert summary["movies"] == 3
+    assert summary["edges"] == 5
+    assert summary["components"] == 3
+    assert summary["giant_component_size"] == 5
+    assert summary["bfs_samples"] == 5
+    assert summary["giant_diameter_lower"] == 4
+    assert summary["giant_diameter_upper"] == 4
+
+    assert reports["components"][["size", "people", "movies"]].values.tolist() == [
+        [5, 3, 2], [2, 1, 1], [1, 1, 0],
+    ]
+
+    degrees = reports["degree_distribution"]
+    assert degrees.values.tolist() == [
+        ["movie", 1, 1], ["movie", 2, 2], ["person", 0, 1], ["person", 1, 3], ["person", 2, 1],
+    ]
+
+
+def test_single_sample_keeps_its_exact_eccentricity(tmp_path):
+    reports = _run(tmp_path, samples=1)
+    nodes = reports["node_metrics"].set_index("id")
+
+    sampled = nodes.index[nodes["eccentricity_exact"]]
+    assert len(sampled) == 1
+    assert nodes.loc[sampled[0], "eccentricity"] == TRUE_ECCENTRICITY[sampled[0]]
+
+    # Every other giant component node only gets its distance to the sample as a lower bound
+    for node_id, true_ecc in TRUE_ECCENTRICITY.items():
+        assert 0 < nodes.loc[node_id, "eccentricity"] <= true_ecc
+
+    summary = reports["summary"].iloc[0]
+    ecc = TRUE_ECCENTRICITY[sampled[0]]
+    assert summary["giant_diameter_lower"] == ecc
+    assert summary["giant_diameter_upper"] == 2 * ecc
+
@@ -0,0 +1,215 @@
+import os
+import multiprocessing as mp
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+# Configuration
+INPUT_DIR = "data/import"
+OUTPUT_DIR = "data/analytics"
+
+# Number of BFS sources sampled from the giant component
+BFS_SAMPLES = 64
+# Sources handled by one worker task
+BFS_BATCH = 4
+# Person rows per chunk when projecting the person-person co-star graph
+COSTAR_CHUNK = 50000
+WORKERS = max(1, (os.cpu_count() or 1) - 1)
+SEED = 42
+
+# Shared with worker processes through the pool initializer
+_adjacency = None
+_incidence = None
+
+def load_graph(input_dir=INPUT_DIR):
+    print("Loading Graph...")
+    # The import files have no header rows (see prepare_import.py)
+    people = pd.read_csv(os.path.join(input_dir, "people.csv"), header=None, usecols=[0], names=['nconst'], dtype=str)['nconst']
+    movies = pd.read_csv(os.path.join(input_dir, "movies.csv"), header=None, usecols=[0], names=['tconst'], dtype=str)['tconst']
+    roles = pd.read_csv(os.path.join(input_dir, "roles.csv"), header=None, usecols=[0, 1], names=['tconst', 'nconst'], dtype=str)
+
+    # Persons are nodes 0..P-1, movies are nodes P..P+M-1
+    person_idx = pd.Index(people).get_indexer(roles['nconst'])
+    movie_idx = pd.Index(movies).get_indexer(roles['tconst'])
+
+    # Drop roles pointing at nodes that are not in the import files
+    valid = (person_idx >= 0) & (movie_idx >= 0)
+    person_idx = person_idx[valid]
+    movie_idx = movie_idx[valid]
+
+    # Person x Movie incidence; a person with several categories in one movie is one edge
+    incidence = sparse.csr_matrix(
+        (np.ones(len(person_idx), dtype=np.int32), (person_idx, movie_idx)),
+        shape=(len(people), len(movies)),
+    )
+    incidence.data[:] = 1
+
+    adjacency = sparse.bmat([[None, incidence], [incidence.T, None]], format='csr')
+
+    ids = np.concatenate([people.to_numpy(), movies.to_numpy()])
+    types = np.repeat(['person', 'movie'], [len(people), len(movies)])
+
+    print(f"Nodes: {adjacency.shape[0]} ({len(people)} people, {len(movies)} movies), Edges: {incidence.nnz}")
+    return ids, types, adjacency, len(people)
+
+def _init_worker(adjacency, n_people):
+    global _adjacency, _incidence
+    _adjacency = adjacency
+    # The incidence matrix is the top-right block, so only the adjacency is shipped to workers
+    _incidence = adjacency[:n_people, n_people:]
+
+def _bfs_distances(source):
+    # The adjacency is already symmetric, so directed=True avoids a symmetrised copy per call
+    order, pred = csgraph.breadth_first_order(_adjacency, source, directed=True, return_predecessors=True)
+
+    # The BFS queue visits nodes level by level, and children are queued in the order their
+    # parents are dequeued, so parent positions in `order` never decrease. Each level then
+    # ends just before the first node whose parent lies beyond the previous level.
+    n = _adjacency.shape[0]
+    position = np.empty(n, dtype=np.int64)
+    position[order] = np.arange(len(order))
+    parent_position = position[pred[order[1:]]]
+    ends = [1]
+    while ends[-1] < len(order):
+        ends.append(int(np.searchsorted(parent_position, ends[-1])) + 1)
+
+    dist = np.full(n, -1, dtype=np.int32)
+    dist[order] = np.repeat(np.arange(len(ends), dtype=np.int32), np.diff(ends, prepend=0))
+    return dist
+
+def _bfs_batch(sources):
+    n = _adjacency.shape[0]
+    source_ecc = np.zeros(len(sources), dtype=np.int32)
+    max_dist = np.zeros(n, dtype=np.int32)
+    sum_dist = np.zeros(n, dtype=np.float64)
+    hits = np.zeros(n, dtype=np.int32)
+    for i, source in enumerate(sources):
+        dist = _bfs_distances(source)
+        source_ecc[i] = dist.max()
+        np.maximum(max_dist, dist, out=max_dist)
+        # Unreached nodes and the source itself do not count towards closeness
+        counted = dist > 0
+        sum_dist += np.where(counted, dist, 0)
+        hits += counted
+    return sources, source_ecc, max_dist, sum_dist, hits
+
+def _costar_chunk(bounds):
+    start, stop = bounds
+    # Rows of B @ B.T are the people sharing at least one movie, including the person itself
+    costars = (_incidence[start:stop] @ _incidence.T).getnnz(axis=1)
+    return start, np.maximum(costars - 1, 0)
+
+def compute_components(adjacency):
+    print("\nComputing Connected Components...")
+    n_components, labels = csgraph.connected_components(adjacency, directed=False)
+    sizes = np.bincount(labels)
+    print(f"Components: {n_components}, Giant Component: {sizes.max()} nodes")
+    return labels, sizes
+
+def compute_eccentricity(pool, labels, sizes, samples=BFS_SAMPLES):
+    print("\nSampling Multi-Source BFS...")
+    n = len(labels)
+    giant = np.flatnonzero(labels == sizes.argmax())
+    rng = np.random.default_rng(SEED)
+    sources = rng.choice(giant, size=min(samples, len(giant)), replace=False)
+    batches = [sources[i:i + BFS_BATCH] for i in range(0, len(sources), BFS_BATCH)]
+
+    ecc = np.full(n, -1, dtype=np.int32)
+    max_dist = np.zeros(n, dtype=np.int32)
+    sum_dist = np.zeros(n, dtype=np.float64)
+    hits = np.zeros(n, dtype=np.int32)
+    source_ecc = []
+    for batch_sources, batch_ecc, batch_max, batch_sum, batch_hits in pool.imap_unordered(_bfs_batch, batches):
+        ecc[batch_sources] = batch_ecc
+        source_ecc.append(batch_ecc)
+        np.maximum(max_dist, batch_max, out=max_dist)
+        sum_dist += batch_sum
+        hits += batch_hits
+    source_ecc = np.concatenate(source_ecc)
+
+    # Sampled sources get their exact eccentricity. For every other node ecc(v) >= d(v, s)
+    # for each sample s, so the sampled maximum is a lower bound.
+    exact = ecc >= 0
+    ecc = np.where(exact, ecc, np.where(hits > 0, max_dist, -1))
+    # Closeness estimated from the mean distance to the sampled sources
+    with np.errstate(divide='ignore', invalid='ignore'):
+        closeness = np.where(sum_dist > 0, hits / sum_dist, np.nan)
+
+    # The giant component's diameter lies between the largest sampled eccentricity and twice the smallest
+    diameter = (int(source_ecc.max()), int(2 * source_ecc.min()))
+    print(f"Sources: {len(sources)}, Giant Component Diameter Bounds (hops): {diameter[0]}..{diameter[1]}")
+    return ecc, exact, closeness, diameter, len(sources)
+
+def compute_costar_degree(pool, n_people):
+    print("\nProjecting Co-Star Degree...")
+    chunks = [(i, min(i + COSTAR_CHUNK, n_people)) for i in range(0, n_people, COSTAR_CHUNK)]
+
+    costar = np.zeros(n_people, dtype=np.int64)
+    for start, values in pool.imap_unordered(_costar_chunk, chunks):
+        costar[start:start + len(values)] = values
+    print(f"Max Co-Star Degree: {costar.max()}")
+    return costar
+
+def write_reports(output_dir, ids, types, degree, labels, sizes, costar, ecc, exact, closeness, diameter, n_sources):
+    print("\nWriting Reports...")
+    os.makedirs(output_dir, exist_ok=True)
+    n_people = len(costar)
+    n_movies = len(ids) - n_people
+
+    # Co-star degree only applies to people; eccentricity only to nodes reached by a sample
+    costar = np.concatenate([costar, np.full(n_movies, -1)])
+    nodes = pd.DataFrame({
+        'id': ids,
+        'type': types,
+        'degree': degree,
+        'component': labels,
+        'component_size': sizes[labels],
+        'costar_degree': pd.arrays.IntegerArray(costar, costar < 0),
+        'eccentricity': pd.arrays.IntegerArray(ecc, ecc < 0),
+        'eccentricity_exact': exact,
+        'closeness': closeness,
+    })
+    nodes.to_parquet(os.path.join(output_dir, "node_metrics.parquet"), index=False)
+
+    degrees = (nodes.groupby(['type', 'degree']).size()
+               .rename('count').reset_index())
+    degrees.to_parquet(os.path.join(output_dir, "degree_distribution.parquet"), index=False)
+
+    is_person = types == 'person'
+    components = pd.DataFrame({
+        'component': np.arange(len(sizes)),
+        'size': sizes,
+        'people': np.bincount(labels[is_person], minlength=len(sizes)),
+        'movies': np.bincount(labels[~is_person], minlength=len(sizes)),
+    }).sort_values('size', ascending=False)
+    components.to_parquet(os.path.join(output_dir, "components.parquet"), index=False)
+
+    summary = pd.DataFrame([{
+        'nodes': len(ids),
+        'people': n_people,
+        'movies': n_movies,
+        'edges': int(degree.sum() // 2),
+        'components': len(sizes),
+        'giant_component_size': int(sizes.max()),
+        'bfs_samples': n_sources,
+        'giant_diameter_lower': diameter[0],
+        'giant_diameter_upper': diameter[1],
+    }])
+    summary.to_parquet(os.path.join(output_dir, "summary.parquet"), index=False)
+
+def run_analytics(input_dir=INPUT_DIR, output_dir=OUTPUT_DIR, workers=WORKERS, samples=BFS_SAMPLES):
+    ids, types, adjacency, n_people = load_graph(input_dir)
+    degree = adjacency.getnnz(axis=1)
+    labels, sizes = compute_components(adjacency)
+
+    with mp.Pool(workers, initializer=_init_worker, initargs=(adjacency, n_people)) as pool:
+        ecc, exact, closeness, diameter, n_sources = compute_eccentricity(pool, labels, sizes, samples)
+        costar = compute_costar_degree(pool, n_people)
+
+    write_reports(output_dir, ids, types, degree, labels, sizes, costar, ecc, exact, closeness, diameter, n_sources)
+
+if __name__ == "__main__":
+    run_analytics()
+    print(f"\nAnalytics Complete! Check '{OUTPUT_DIR}' folder.")